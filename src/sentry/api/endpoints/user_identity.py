@@ -13,7 +13,7 @@ class UserIdentityEndpoint(UserEndpoint):
         :pparam string user ID: user ID, or 'me'
         :auth: required
         """
-        queryset = Identity.objects.filter(user=user)
+        queryset = Identity.objects.filter(user=user).select_related("idp")
 
         provider = request.GET.get("provider")
         if provider:
@@ -1,5 +1,6 @@
 import re
-from collections import namedtuple
+import threading
+from collections import OrderedDict, namedtuple
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any, List, Mapping, NamedTuple, Sequence, Set, Tuple, Union
@@ -28,6 +29,7 @@ from sentry.search.utils import (
     parse_numeric_value,
     parse_percentage,
 )
+from sentry.utils import metrics
 from sentry.utils.compat import filter, map
 from sentry.utils.snuba import is_duration_measurement, is_measurement, is_span_op_breakdown
 from sentry.utils.validators import is_event_id
@@ -1037,12 +1039,47 @@ default_config = SearchConfig(
 )
 
 
+PARSE_CACHE_SIZE = 1024
+# Parse trees grow with the query, so only short queries are cached to bound memory use
+PARSE_CACHE_MAX_QUERY_LENGTH = 256
+_parse_cache: "OrderedDict[str, Node]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _parse_query_tree(query: str) -> Node:
+    """
+    Parses `query` into a parse tree, reusing the tree of a recently seen query.
+    Only the grammar parse is cached: the tree depends on nothing but the query
+    string, whereas visiting it depends on the config, params and the current time
+    (for relative dates).
+    """
+    if len(query) > PARSE_CACHE_MAX_QUERY_LENGTH:
+        return event_search_grammar.parse(query)
+
+    with _parse_cache_lock:
+        tree = _parse_cache.get(query)
+        if tree is not None:
+            _parse_cache.move_to_end(query)
+
+    if tree is not None:
+        metrics.incr("search.parse_cache.hit", sample_rate=0.1)
+        return tree
+
+    metrics.incr("search.parse_cache.miss", sample_rate=0.1)
+    tree = event_search_grammar.parse(query)
+    with _parse_cache_lock:
+        _parse_cache[query] = tree
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return tree
+
+
 def parse_search_query(query, config=None, params=None) -> Sequence[SearchFilter]:
     if config is None:
         config = default_config
 
     try:
-        tree = event_search_grammar.parse(query)
+        tree = _parse_query_tree(query)
     except IncompleteParseError as e:
         idx = e.column()
         prefix = query[max(0, idx - 5) : idx]
@@ -4,7 +4,7 @@ from datetime import timedelta
 from uuid import uuid4
 
 import sentry_sdk
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connections, router, transaction
 from django.db.models import Q
 from django.utils import timezone
 from rest_framework import serializers
@@ -50,11 +50,10 @@ from sentry.models import (
     remove_group_from_inbox,
 )
 from sentry.models.group import STATUS_UPDATE_CHOICES, looks_like_short_id
-from sentry.models.groupinbox import GroupInbox, GroupInboxRemoveAction, add_group_to_inbox
+from sentry.models.groupinbox import GroupInboxRemoveAction, add_group_to_inbox
 from sentry.notifications.types import SUBSCRIPTION_REASON_MAP, GroupSubscriptionReason
 from sentry.signals import (
     advanced_search_feature_gated,
-    issue_deleted,
     issue_ignored,
     issue_mark_reviewed,
     issue_resolved,
@@ -62,6 +61,7 @@ from sentry.signals import (
     issue_unresolved,
 )
 from sentry.tasks.deletion import delete_groups as delete_groups_task
+from sentry.tasks.deletion import send_issue_deleted_signals
 from sentry.tasks.integrations import kick_off_status_syncs
 from sentry.tasks.merge import merge_groups
 from sentry.utils import metrics
@@ -79,9 +79,11 @@ class ValidationError(Exception):
 
 
 def build_query_params_from_request(request, organization, projects, environments):
-    query_kwargs = {"projects": projects, "sort_by": request.GET.get("sort", DEFAULT_SORT_OPTION)}
+    params = request.GET
+    sort = params.get("sort", DEFAULT_SORT_OPTION)
+    query_kwargs = {"projects": projects, "sort_by": sort}
 
-    limit = request.GET.get("limit")
+    limit = params.get("limit")
     if limit:
         try:
             query_kwargs["limit"] = int(limit)
@@ -89,14 +91,15 @@ def build_query_params_from_request(request, organization, projects, environment
             raise ValidationError("invalid limit")
 
     # TODO: proper pagination support
-    if request.GET.get("cursor"):
+    cursor = params.get("cursor")
+    if cursor:
         try:
-            query_kwargs["cursor"] = Cursor.from_string(request.GET.get("cursor"))
+            query_kwargs["cursor"] = Cursor.from_string(cursor)
         except ValueError:
             raise ParseError(detail="Invalid cursor parameter.")
-    query = request.GET.get("query", "is:unresolved").strip()
+    query = params.get("query", "is:unresolved").strip()
     sentry_sdk.set_tag("search.query", query)
-    sentry_sdk.set_tag("search.sort", query)
+    sentry_sdk.set_tag("search.sort", sort)
     if projects:
         sentry_sdk.set_tag("search.projects", len(projects) if len(projects) <= 5 else ">5")
     if environments:
@@ -117,12 +120,16 @@ def build_query_params_from_request(request, organization, projects, environment
     return query_kwargs
 
 
-# List of conditions that mark a SearchFilter as an advanced search. Format is
-# (lambda SearchFilter(): <boolean condition>, '<feature_name')
-advanced_search_features = [
-    (lambda search_filter: search_filter.is_negation, "negative search"),
-    (lambda search_filter: search_filter.value.is_wildcard(), "wildcard search"),
-]
+def get_advanced_search_feature(search_filter):
+    """
+    Returns the name of the advanced search feature used by `search_filter`, or
+    `None` if it only uses basic search features.
+    """
+    if search_filter.is_negation:
+        return "negative search"
+    if search_filter.value.is_wildcard():
+        return "wildcard search"
+    return None
 
 
 def validate_search_filter_permissions(organization, search_filters, user):
@@ -140,14 +147,14 @@ def validate_search_filter_permissions(organization, search_filters, user):
         return
 
     for search_filter in search_filters:
-        for feature_condition, feature_name in advanced_search_features:
-            if feature_condition(search_filter):
-                advanced_search_feature_gated.send_robust(
-                    user=user, organization=organization, sender=validate_search_filter_permissions
-                )
-                raise ValidationError(
-                    f"You need access to the advanced search feature to use {feature_name}"
-                )
+        feature_name = get_advanced_search_feature(search_filter)
+        if feature_name is not None:
+            advanced_search_feature_gated.send_robust(
+                user=user, organization=organization, sender=validate_search_filter_permissions
+            )
+            raise ValidationError(
+                f"You need access to the advanced search feature to use {feature_name}"
+            )
 
 
 def get_by_short_id(organization_id, is_short_id_lookup, query):
@@ -353,16 +360,32 @@ def delete_group_list(request, project, group_list, delete_type):
     transaction_id = uuid4().hex
 
     # We do not want to delete split hashes as they are necessary for keeping groups... split.
-    GroupHash.objects.filter(
-        project_id=project.id, group__id__in=group_ids, state=GroupHash.State.SPLIT
-    ).update(group=None)
-    GroupHash.objects.filter(project_id=project.id, group__id__in=group_ids).exclude(
-        state=GroupHash.State.SPLIT
-    ).delete()
+    # We also remove `GroupInbox` rows here so that they don't end up influencing queries for
+    # `Group` instances that are pending deletion.
+    # All statements are sent in a single round trip; neither GroupHash nor GroupInbox have
+    # dependent relations, so bypassing the ORM's cascading delete is safe.
+    using = router.db_for_write(GroupHash)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            UPDATE sentry_grouphash SET group_id = NULL
+            WHERE project_id = %(project_id)s AND group_id = ANY(%(group_ids)s)
+            AND state = %(split)s;
+            DELETE FROM sentry_grouphash
+            WHERE project_id = %(project_id)s AND group_id = ANY(%(group_ids)s)
+            AND (state IS NULL OR state <> %(split)s);
+            DELETE FROM sentry_groupinbox
+            WHERE project_id = %(project_id)s AND group_id = ANY(%(group_ids)s);
+            """,
+            {"project_id": project.id, "group_ids": group_ids, "split": GroupHash.State.SPLIT},
+        )
 
-    # We remove `GroupInbox` rows here so that they don't end up influencing queries for
-    # `Group` instances that are pending deletion
-    GroupInbox.objects.filter(project_id=project.id, group__id__in=group_ids).delete()
+    # Signal receivers may hit the database for every group, so keep them out of the
+    # request. The task reloads the groups, so it has to be queued before (and run on a
+    # different queue than) `delete_groups_task`, which removes them.
+    send_issue_deleted_signals.apply_async(
+        kwargs={"object_ids": group_ids, "user_id": request.user.id, "delete_type": delete_type}
+    )
 
     delete_groups_task.apply_async(
         kwargs={
@@ -373,27 +396,23 @@ def delete_group_list(request, project, group_list, delete_type):
         countdown=3600,
     )
 
-    for group in group_list:
+    delete_logger.info(
+        "object.delete.queued",
+        extra={
+            "object_ids": group_ids,
+            "organization_id": project.organization_id,
+            "transaction_id": transaction_id,
+            "model": Group.__name__,
+        },
+    )
+
+    for group_id in group_ids:
         create_audit_entry(
             request=request,
             transaction_id=transaction_id,
             logger=audit_logger,
             organization_id=project.organization_id,
-            target_object=group.id,
-        )
-
-        delete_logger.info(
-            "object.delete.queued",
-            extra={
-                "object_id": group.id,
-                "organization_id": project.organization_id,
-                "transaction_id": transaction_id,
-                "model": type(group).__name__,
-            },
-        )
-
-        issue_deleted.send_robust(
-            group=group, user=request.user, delete_type=delete_type, sender=delete_group_list
+            target_object=group_id,
         )
 
 
@@ -404,31 +423,32 @@ def delete_groups(request, projects, organization_id, search_fn):
     """
     group_ids = request.GET.getlist("id")
     if group_ids:
-        group_list = list(
+        # `delete_group_list` only needs these columns, so skip loading the rest
+        group_list = (
             Group.objects.filter(
                 project__in=projects,
                 project__organization_id=organization_id,
                 id__in=set(group_ids),
-            ).exclude(status__in=[GroupStatus.PENDING_DELETION, GroupStatus.DELETION_IN_PROGRESS])
+            )
+            .exclude(status__in=[GroupStatus.PENDING_DELETION, GroupStatus.DELETION_IN_PROGRESS])
+            .only("id", "project_id", "times_seen")
         )
     else:
         try:
             # bulk mutations are limited to 1000 items
             # TODO(dcramer): it'd be nice to support more than this, but its
             # a bit too complicated right now
-            cursor_result, _ = search_fn({"limit": 1000, "paginator_options": {"max_limit": 1000}})
+            group_list, _ = search_fn({"limit": 1000, "paginator_options": {"max_limit": 1000}})
         except ValidationError as exc:
             return Response({"detail": str(exc)}, status=400)
 
-        group_list = list(cursor_result)
-
-    if not group_list:
-        return Response(status=204)
-
     groups_by_project_id = defaultdict(list)
     for group in group_list:
         groups_by_project_id[group.project_id].append(group)
 
+    if not groups_by_project_id:
+        return Response(status=204)
+
     for project in projects:
         delete_group_list(
             request, project, groups_by_project_id.get(project.id), delete_type="delete"
@@ -499,9 +519,12 @@ def build_rate_limit_key(function, request):
 
 def rate_limit_endpoint(limit=1, window=1):
     def inner(function):
+        # the qualname hash never changes, so compute it once rather than on every request
+        key_prefix = f"rate_limit_endpoint:{md5_text(function.__qualname__).hexdigest()}"
+
         def wrapper(self, request, *args, **kwargs):
             if ratelimiter.is_limited(
-                build_rate_limit_key(function, request),
+                f"{key_prefix}:{request.META['REMOTE_ADDR']}",
                 limit=limit,
                 window=window,
             ):
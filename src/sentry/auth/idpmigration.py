@@ -1,9 +1,10 @@
-import string
+import secrets
 from dataclasses import dataclass
 from datetime import timedelta
+from typing import Optional
 
+import msgpack
 from django.urls import reverse
-from django.utils.crypto import get_random_string
 
 from sentry import options
 from sentry.models import Organization, OrganizationMember, User
@@ -22,6 +23,7 @@ def send_one_time_account_confirm_link(
     provider_name: str,
     email: str,
     identity_id: str,
+    member_id: Optional[int] = None,
 ) -> "AccountConfirmLink":
     """Store and email a verification key for IdP migration.
 
@@ -35,8 +37,10 @@ def send_one_time_account_confirm_link(
     :param provider_name: a display name for the SSO provider
     :param email: the email address associated with the SSO identity
     :param identity_id: the SSO identity id
+    :param member_id: the id of the user's membership in the organization, if
+        already known by the caller
     """
-    link = AccountConfirmLink(user, org, provider_name, email, identity_id)
+    link = AccountConfirmLink(user, org, provider_name, email, identity_id, member_id)
     link.store_in_redis()
     link.send_confirm_email()
     return link
@@ -49,9 +53,11 @@ class AccountConfirmLink:
     provider_name: str
     email: str
     identity_id: str
+    member_id: Optional[int] = None
 
     def __post_init__(self):
-        self.verification_code = get_random_string(32, string.ascii_letters + string.digits)
+        # 24 random bytes encode to 32 url-safe characters
+        self.verification_code = secrets.token_urlsafe(24)
         self.verification_key = get_redis_key(self.verification_code)
 
     def send_confirm_email(self) -> None:
@@ -79,18 +85,22 @@ class AccountConfirmLink:
 
     def store_in_redis(self) -> None:
         cluster = redis.clusters.get("default").get_local_client_for_key(_REDIS_KEY)
-        member_id = OrganizationMember.objects.get(
-            organization=self.organization, user=self.user
-        ).id
+        if self.member_id is None:
+            self.member_id = (
+                OrganizationMember.objects.filter(organization=self.organization, user=self.user)
+                .values_list("id", flat=True)
+                .get()
+            )
 
         verification_value = {
             "user_id": self.user.id,
             "email": self.email,
-            "member_id": member_id,
+            "member_id": self.member_id,
             "identity_id": self.identity_id,
         }
-        cluster.hmset(self.verification_key, verification_value)
-        cluster.expire(self.verification_key, int(_TTL.total_seconds()))
+        cluster.set(
+            self.verification_key, msgpack.packb(verification_value), ex=int(_TTL.total_seconds())
+        )
 
 
 def get_redis_key(verification_key: str) -> str:
@@ -111,8 +121,4 @@ def verify_account(key: str) -> bool:
     cluster = redis.clusters.get("default").get_local_client_for_key(_REDIS_KEY)
 
     verification_key = get_redis_key(key)
-    verification_value_byte = cluster.hgetall(verification_key)
-    if not verification_value_byte:
-        return False
-
-    return True
+    return bool(cluster.exists(verification_key))
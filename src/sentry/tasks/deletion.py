@@ -150,3 +150,27 @@ def delete_groups(object_ids, transaction_id=None, eventstream_state=None, **kwa
         # all groups have been deleted
         if eventstream_state:
             eventstream.end_delete_groups(eventstream_state)
+
+
+# Runs on the default queue so that a backlog of deletion work on `cleanup` can't delay it
+# past `delete_groups`, which would remove the groups before their signals are sent.
+@instrumented_task(name="sentry.tasks.deletion.send_issue_deleted_signals", queue="default")
+def send_issue_deleted_signals(object_ids, user_id=None, delete_type=None, **kwargs):
+    from sentry.models import Group, User
+    from sentry.signals import issue_deleted
+
+    user = User.objects.filter(id=user_id).first() if user_id else None
+
+    # Groups that were already removed can no longer be passed to receivers, so their
+    # signals are dropped.
+    groups = list(Group.objects.filter(id__in=object_ids).select_related("project"))
+    if len(groups) < len(object_ids):
+        logger.info(
+            "issue_deleted.groups_missing",
+            extra={"missing": len(object_ids) - len(groups), "delete_type": delete_type},
+        )
+
+    for group in groups:
+        issue_deleted.send_robust(
+            group=group, user=user, delete_type=delete_type, sender=send_issue_deleted_signals
+        )
@@ -2,17 +2,35 @@ from django.http import QueryDict
 
 from sentry.api.helpers.group_index import (
     ValidationError,
+    build_query_params_from_request,
     build_rate_limit_key,
+    delete_group_list,
+    rate_limit_endpoint,
     update_groups,
     validate_search_filter_permissions,
 )
 from sentry.api.issue_search import parse_search_query
-from sentry.models import GroupInbox, GroupInboxReason, GroupStatus, add_group_to_inbox
+from sentry.models import GroupHash, GroupInbox, GroupInboxReason, GroupStatus, add_group_to_inbox
 from sentry.testutils import TestCase
 from sentry.utils.compat.mock import Mock, patch
 from sentry.utils.hashlib import md5_text
 
 
+class BuildQueryParamsFromRequestTest(TestCase):
+    @patch("sentry.api.helpers.group_index.sentry_sdk.set_tag")
+    def test_search_tags(self, mock_set_tag):
+        request = self.make_request(user=self.user, method="GET")
+        request.GET = QueryDict(query_string="sort=date&query=is:unresolved")
+
+        query_kwargs = build_query_params_from_request(
+            request, self.organization, [self.project], None
+        )
+
+        assert query_kwargs["sort_by"] == "date"
+        mock_set_tag.assert_any_call("search.query", "is:unresolved")
+        mock_set_tag.assert_any_call("search.sort", "date")
+
+
 class ValidateSearchFilterPermissionsTest(TestCase):
     def run_test(self, query):
         validate_search_filter_permissions(self.organization, parse_search_query(query), self.user)
@@ -176,7 +194,69 @@ class BuildRateLimitKeyTest(TestCase):
     def some_function(self):
         pass
 
+    def some_endpoint(self, request):
+        pass
+
     def test(self):
         request = self.make_request()
         expected = f"rate_limit_endpoint:{md5_text('BuildRateLimitKeyTest.some_function').hexdigest()}:{request.META['REMOTE_ADDR']}"
         assert build_rate_limit_key(self.some_function, request) == expected
+
+    @patch("sentry.api.helpers.group_index.ratelimiter")
+    def test_rate_limit_endpoint(self, mock_ratelimiter):
+        mock_ratelimiter.is_limited.return_value = False
+        request = self.make_request()
+        rate_limit_endpoint(limit=5, window=1)(BuildRateLimitKeyTest.some_endpoint)(self, request)
+        mock_ratelimiter.is_limited.assert_called_once_with(
+            build_rate_limit_key(self.some_endpoint, request), limit=5, window=1
+        )
+
+
+class DeleteGroupListTest(TestCase):
+    @patch("sentry.api.helpers.group_index.send_issue_deleted_signals.apply_async")
+    @patch("sentry.api.helpers.group_index.delete_groups_task.apply_async")
+    def test_group_hashes_and_inbox(self, mock_apply_async, mock_send_signals):
+        group = self.create_group()
+        other_group = self.create_group()
+        hash_ = GroupHash.objects.create(project=self.project, group=group, hash="a" * 32)
+        split_hash = GroupHash.objects.create(
+            project=self.project, group=group, hash="b" * 32, state=GroupHash.State.SPLIT
+        )
+        other_hash = GroupHash.objects.create(
+            project=self.project, group=other_group, hash="c" * 32
+        )
+        add_group_to_inbox(group, GroupInboxReason.NEW)
+        add_group_to_inbox(other_group, GroupInboxReason.NEW)
+
+        request = self.make_request(user=self.user, method="DELETE")
+        request.user = self.user
+        delete_group_list(request, self.project, [group], delete_type="delete")
+
+        assert not GroupHash.objects.filter(id=hash_.id).exists()
+        split_hash.refresh_from_db()
+        assert split_hash.group_id is None
+        other_hash.refresh_from_db()
+        assert other_hash.group_id == other_group.id
+        assert not GroupInbox.objects.filter(group=group).exists()
+        assert GroupInbox.objects.filter(group=other_group).exists()
+        assert mock_apply_async.call_args[1]["kwargs"]["object_ids"] == [group.id]
+        mock_send_signals.assert_called_once_with(
+            kwargs={"object_ids": [group.id], "user_id": self.user.id, "delete_type": "delete"}
+        )
+
+    @patch("sentry.api.helpers.group_index.send_issue_deleted_signals.apply_async")
+    @patch("sentry.api.helpers.group_index.delete_groups_task.apply_async")
+    def test_signals_queued_before_deletion(self, mock_delete_groups, mock_send_signals):
+        manager = Mock()
+        manager.attach_mock(mock_delete_groups, "delete_groups")
+        manager.attach_mock(mock_send_signals, "send_issue_deleted_signals")
+
+        group = self.create_group()
+        request = self.make_request(user=self.user, method="DELETE")
+        request.user = self.user
+        delete_group_list(request, self.project, [group], delete_type="delete")
+
+        assert [name for name, _, _ in manager.mock_calls] == [
+            "send_issue_deleted_signals",
+            "delete_groups",
+        ]
@@ -1,5 +1,6 @@
 import datetime
 import os
+from collections import OrderedDict
 from datetime import timedelta
 
 import pytest
@@ -8,6 +9,7 @@ from django.utils import timezone
 from freezegun import freeze_time
 
 from sentry.api.event_search import (
+    PARSE_CACHE_MAX_QUERY_LENGTH,
     AggregateKey,
     SearchConfig,
     SearchFilter,
@@ -19,6 +21,7 @@ from sentry.constants import MODULE_ROOT
 from sentry.exceptions import InvalidSearchQuery
 from sentry.search.utils import parse_datetime_string, parse_duration, parse_numeric_value
 from sentry.utils import json
+from sentry.utils.compat.mock import patch
 
 fixture_path = "tests/fixtures/search-syntax"
 abs_fixtures_path = os.path.join(MODULE_ROOT, os.pardir, os.pardir, fixture_path)
@@ -241,6 +244,42 @@ class ParseSearchQueryBackendTest(SimpleTestCase):
                 SearchFilter(key=SearchKey(name="random"), operator="=", value=SearchValue("-2w"))
             ]
 
+    @patch("sentry.api.event_search._parse_cache", new_callable=OrderedDict)
+    @patch("sentry.api.event_search.metrics.incr")
+    def test_parse_cache_metrics(self, mock_incr, mock_parse_cache):
+        query = "parse_cache_metrics:test"
+        parse_search_query(query)
+        parse_search_query(query)
+        assert [call[0][0] for call in mock_incr.call_args_list] == [
+            "search.parse_cache.miss",
+            "search.parse_cache.hit",
+        ]
+        assert list(mock_parse_cache) == [query]
+
+    @patch("sentry.api.event_search._parse_cache", new_callable=OrderedDict)
+    @patch("sentry.api.event_search.metrics.incr")
+    def test_parse_cache_skips_long_queries(self, mock_incr, mock_parse_cache):
+        query = "message:" + "a" * PARSE_CACHE_MAX_QUERY_LENGTH
+        parse_search_query(query)
+        parse_search_query(query)
+        assert not mock_incr.called
+        assert not mock_parse_cache
+
+    def test_rel_time_filter_cached_query(self):
+        now = timezone.now()
+        with freeze_time(now):
+            parse_search_query("first_seen:-1d")
+
+        later = now + timedelta(hours=1)
+        with freeze_time(later):
+            assert parse_search_query("first_seen:-1d") == [
+                SearchFilter(
+                    key=SearchKey(name="first_seen"),
+                    operator=">=",
+                    value=SearchValue(raw_value=later - timedelta(days=1)),
+                )
+            ]
+
     def test_aggregate_rel_time_filter(self):
         now = timezone.now()
         with freeze_time(now):
@@ -1,10 +1,13 @@
 import re
 
+import msgpack
 from django.urls import reverse
 
 import sentry.auth.idpmigration as idpmigration
 from sentry.models import OrganizationMember
 from sentry.testutils import TestCase
+from sentry.utils import redis
+from sentry.utils.compat.mock import patch
 
 
 class IDPMigrationTests(TestCase):
@@ -15,13 +18,45 @@ class IDPMigrationTests(TestCase):
         self.email = "test@example.com"
         self.org = self.create_organization()
         self.provider = "test_provider"
-        OrganizationMember.objects.create(organization=self.org, user=self.user)
+        self.member = OrganizationMember.objects.create(organization=self.org, user=self.user)
 
     def test_send_one_time_account_confirm_link(self):
         link = idpmigration.send_one_time_account_confirm_link(
             self.user, self.org, self.provider, self.email, "drgUQCLzOyfHxmTyVs0G"
         )
-        assert re.match(r"auth:one-time-key:\w{32}", link.verification_key)
+        assert re.match(r"auth:one-time-key:[\w-]{32}$", link.verification_key)
+
+        cluster = redis.clusters.get("default").get_local_client_for_key(idpmigration._REDIS_KEY)
+        assert msgpack.unpackb(cluster.get(link.verification_key)) == {
+            "user_id": self.user.id,
+            "email": self.email,
+            "member_id": self.member.id,
+            "identity_id": "drgUQCLzOyfHxmTyVs0G",
+        }
+        assert 0 < cluster.ttl(link.verification_key) <= idpmigration._TTL.total_seconds()
+        assert link.member_id == self.member.id
+
+    # Emails read DB-backed options, so keep them out of the query count
+    @patch("sentry.auth.idpmigration.AccountConfirmLink.send_confirm_email")
+    def test_send_one_time_account_confirm_link_with_member_id(self, mock_send_confirm_email):
+        with self.assertNumQueries(0):
+            link = idpmigration.send_one_time_account_confirm_link(
+                self.user,
+                self.org,
+                self.provider,
+                self.email,
+                "drgUQCLzOyfHxmTyVs0G",
+                member_id=self.member.id,
+            )
+
+        assert mock_send_confirm_email.called
+        cluster = redis.clusters.get("default").get_local_client_for_key(idpmigration._REDIS_KEY)
+        assert msgpack.unpackb(cluster.get(link.verification_key)) == {
+            "user_id": self.user.id,
+            "email": self.email,
+            "member_id": self.member.id,
+            "identity_id": "drgUQCLzOyfHxmTyVs0G",
+        }
 
     def test_verify_account(self):
         link = idpmigration.send_one_time_account_confirm_link(
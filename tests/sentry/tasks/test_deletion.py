@@ -16,8 +16,13 @@ from sentry.models import (
     ScheduledDeletion,
     Team,
 )
-from sentry.signals import pending_delete
-from sentry.tasks.deletion import delete_groups, reattempt_deletions, run_scheduled_deletions
+from sentry.signals import issue_deleted, pending_delete
+from sentry.tasks.deletion import (
+    delete_groups,
+    reattempt_deletions,
+    run_scheduled_deletions,
+    send_issue_deleted_signals,
+)
 from sentry.testutils import TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
 
@@ -183,3 +188,49 @@ class DeleteGroupTest(TestCase):
         assert not Group.objects.filter(id=group.id).exists()
         assert not nodestore.get(node_id)
         assert not nodestore.get(node_id_2)
+
+
+class SendIssueDeletedSignalsTest(TestCase):
+    def test_simple(self):
+        signal_handler = Mock()
+        issue_deleted.connect(signal_handler)
+        self.addCleanup(issue_deleted.disconnect, signal_handler)
+
+        group = self.create_group(status=GroupStatus.PENDING_DELETION)
+        other_group = self.create_group(status=GroupStatus.PENDING_DELETION)
+
+        with self.tasks():
+            send_issue_deleted_signals.apply_async(
+                kwargs={
+                    "object_ids": [group.id, other_group.id],
+                    "user_id": self.user.id,
+                    "delete_type": "delete",
+                }
+            )
+
+        assert signal_handler.call_count == 2
+        calls = sorted(
+            (args["group"].id, args["user"], args["delete_type"])
+            for _, args in signal_handler.call_args_list
+        )
+        assert calls == [
+            (group.id, self.user, "delete"),
+            (other_group.id, self.user, "delete"),
+        ]
+
+    def test_missing_group(self):
+        signal_handler = Mock()
+        issue_deleted.connect(signal_handler)
+        self.addCleanup(issue_deleted.disconnect, signal_handler)
+
+        group = self.create_group(status=GroupStatus.PENDING_DELETION)
+
+        with self.tasks():
+            send_issue_deleted_signals.apply_async(
+                kwargs={"object_ids": [group.id, group.id + 1000], "delete_type": "discard"}
+            )
+
+        assert signal_handler.call_count == 1
+        args = signal_handler.call_args_list[0][1]
+        assert args["group"].id == group.id
+        assert args["user"] is None